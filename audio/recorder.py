@@ -1,12 +1,16 @@
 import sounddevice as sd
 import numpy as np
-import wave
+import soundfile as sf
 from datetime import datetime
 from pathlib import Path
 import logging
 from dataclasses import dataclass
 from typing import Optional, Callable
 
+# Frames clipped and written per step when saving; small enough that a
+# tile and its scratch buffer stay resident in L2
+SAVE_CHUNK_FRAMES = 16384
+
 @dataclass
 class AudioConfig:
     """Configuration settings for audio recording"""
@@ -15,6 +19,8 @@ class AudioConfig:
     dtype: str = 'float32'
     blocksize: int = 1024
     device: Optional[int] = None
+    buffer_seconds: int = 60  # Initial capacity of the recording buffer
+    wav_buffer_bytes: int = 1 << 20  # Write buffer size for saved WAV files
 
 class AudioRecorder:
     """Handles audio recording functionality"""
@@ -24,7 +30,13 @@ class AudioRecorder:
         self.logger = logging.getLogger(__name__)
         self.recording = False
         self.paused = False
-        self._audio_buffer = []
+        self._capacity = self.config.buffer_seconds * self.config.sample_rate
+        self._write_idx = 0
+        self._buf = np.empty((self._capacity, self.config.channels),
+                             dtype=self.config.dtype)
+        self._status_events = 0
+        self._last_status = None
+        self._grow_events = 0
         self.stream = None
         self.current_device = None
         
@@ -41,16 +53,32 @@ class AudioRecorder:
             
         def internal_callback(indata, frames, time_info, status):
             """Internal callback to handle incoming audio data"""
+            # Runs on the PortAudio thread: avoid logging here, it takes
+            # locks and does I/O. Status flags are reported on stop.
             if status:
-                self.logger.warning(f"Recording callback status: {status}")
-            if not self.paused:
-                self._audio_buffer.append(indata.copy())
+                self._status_events += 1
+                self._last_status = status
+            if self.paused:
+                # indata is only valid for the duration of this call and
+                # nothing is stored while paused, so there is no stable
+                # buffer to hand consumers; skip them until resumed
+                return
+            end = self._write_idx + frames
+            if end > self._capacity:
+                self._grow(end)
+            stored = self._buf[self._write_idx:end]
+            stored[:] = indata
+            self._write_idx = end
+            # Hand consumers the stored copy rather than making another one
             if callback:
-                callback(indata, frames, time_info, status)
+                callback(stored, frames, time_info, status)
                 
         try:
             self.recording = True
-            self._audio_buffer = []
+            self._write_idx = 0
+            self._status_events = 0
+            self._last_status = None
+            self._grow_events = 0
             self.stream = sd.InputStream(
                 device=self.current_device,
                 channels=self.config.channels,
@@ -77,6 +105,16 @@ class AudioRecorder:
                 self.stream.stop()
                 self.stream.close()
                 self.stream = None
+            if self._status_events:
+                self.logger.warning(
+                    f"Recording callback reported {self._status_events} "
+                    f"status events, last: {self._last_status}"
+                )
+            if self._grow_events:
+                self.logger.debug(
+                    f"Recording buffer grown {self._grow_events} times, "
+                    f"to {self._capacity} frames"
+                )
             self.logger.info("Recording stopped")
         except Exception as e:
             self.logger.error(f"Error stopping recording: {str(e)}")
@@ -92,9 +130,21 @@ class AudioRecorder:
         self.paused = False
         self.logger.info("Recording resumed")
         
+    def _grow(self, min_capacity: int) -> None:
+        """Enlarge the recording buffer to hold at least min_capacity frames"""
+        # Called from the PortAudio callback, so counted rather than logged;
+        # stop_recording reports it
+        self._capacity = max(min_capacity, self._capacity * 2)
+        self._buf = np.resize(self._buf, (self._capacity, self.config.channels))
+        self._grow_events += 1
+        
+    def get_audio_data(self) -> np.ndarray:
+        """Get the recorded audio as a view into the recording buffer"""
+        return self._buf[:self._write_idx]
+        
     def save_recording(self, filename: str) -> Path:
         """Save the recorded audio to a WAV file"""
-        if not self._audio_buffer:
+        if self._write_idx == 0:
             raise ValueError("No audio data available to save")
             
         try:
@@ -104,18 +154,28 @@ class AudioRecorder:
                 
             filepath = Path(filename)
             
-            # Combine all audio chunks
-            audio_data = np.concatenate(self._audio_buffer)
+            audio_data = self.get_audio_data()
             
-            # Convert to int16 format
-            audio_int16 = np.int16(audio_data * 32767)
+            # Clip overs tile by tile through a reusable scratch buffer;
+            # libsndfile does the float to PCM_16 conversion but would wrap
+            scratch = np.empty((min(SAVE_CHUNK_FRAMES, len(audio_data)),
+                                self.config.channels), dtype=np.float32)
             
             # Save as WAV file
-            with wave.open(str(filepath), 'wb') as wf:
-                wf.setnchannels(self.config.channels)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(self.config.sample_rate)
-                wf.writeframes(audio_int16.tobytes())
+            with open(filepath, 'wb', buffering=self.config.wav_buffer_bytes) as f, \
+                    sf.SoundFile(f, 'w',
+                                 samplerate=self.config.sample_rate,
+                                 channels=self.config.channels,
+                                 format='WAV',
+                                 subtype='PCM_16') as wf:
+                for start in range(0, len(audio_data), SAVE_CHUNK_FRAMES):
+                    chunk = audio_data[start:start + SAVE_CHUNK_FRAMES]
+                    # Input streams rarely exceed full scale, so in-range
+                    # tiles go straight from the recording buffer
+                    if chunk.max() > 1.0 or chunk.min() < -1.0:
+                        chunk = np.clip(chunk, -1.0, 1.0,
+                                        out=scratch[:len(chunk)])
+                    wf.write(chunk)
                 
             self.logger.info(f"Recording saved to {filepath}")
             return filepath
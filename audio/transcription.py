@@ -1,25 +1,40 @@
-import whisper
-import torch
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+import ctranslate2
 import numpy as np
+import soundfile as sf
+from scipy import signal
 import threading
-import queue
+import collections
+import functools
 from typing import Optional, Dict, List, Callable
 from dataclasses import dataclass
 import logging
 from pathlib import Path
 
+# Whisper models expect 16 kHz mono float32 input
+SAMPLE_RATE = 16000
+
+_HAS_CUDA = ctranslate2.get_cuda_device_count() > 0
+
 @dataclass
 class TranscriptionConfig:
     """Configuration for transcription"""
     model_size: str = "medium"
     language: Optional[str] = None
     task: str = "transcribe"
-    device: str = "cuda" if torch.cuda.is_available() else "cpu"
-    compute_type: str = "float16" if torch.cuda.is_available() else "float32"
-    batch_size: int = 8
+    device: str = "cuda" if _HAS_CUDA else "cpu"
+    compute_type: str = "int8_float16" if _HAS_CUDA else "int8"
+    beam_size: int = 5
+    vad_filter: bool = True
+    batch_size: int = 8  # 30 s windows decoded together (with vad_filter)
+
+@functools.lru_cache(maxsize=2)
+def _load_model(model_size: str, device: str, compute_type: str) -> WhisperModel:
+    """Load a Whisper model, reusing it across managers and re-initializations"""
+    return WhisperModel(model_size, device=device, compute_type=compute_type)
 
 class TranscriptionManager:
-    """Manages audio transcription using Whisper"""
+    """Manages audio transcription using Whisper (CTranslate2 backend)"""
     
     def __init__(self, config: Optional[TranscriptionConfig] = None):
         self.config = config or TranscriptionConfig()
@@ -27,28 +42,28 @@ class TranscriptionManager:
         
         # Initialize state
         self.model = None
-        self._transcription_queue = queue.Queue()
-        self._result_queue = queue.Queue()
+        self._pipeline = None
+        # Single producer / single consumer each way, so plain deques
+        # (atomic append/popleft) replace queue.Queue's lock + condition
+        self._transcription_queue = collections.deque()
+        self._result_queue = collections.deque()
+        self._wake = threading.Event()
         self._is_processing = False
         
         # Threading
         self._process_thread = None
-        self._lock = threading.Lock()
+        self._init_lock = threading.Lock()
     
     def initialize_model(self) -> bool:
         """Initialize the Whisper model"""
         try:
-            if self.model:
-                del self.model
-                torch.cuda.empty_cache()
-            
-            self.model = whisper.load_model(
-                self.config.model_size,
-                device=self.config.device
-            )
-            
-            if self.config.device == "cuda":
-                self.model = self.model.to(torch.float16)
+            with self._init_lock:
+                self.model = _load_model(
+                    self.config.model_size,
+                    self.config.device,
+                    self.config.compute_type
+                )
+                self._pipeline = BatchedInferencePipeline(model=self.model)
             
             self.logger.info(f"Initialized Whisper model: {self.config.model_size}")
             return True
@@ -61,10 +76,9 @@ class TranscriptionManager:
         """Start the transcription processing thread"""
         if self._is_processing:
             return
-            
-        if not self.model:
-            self.initialize_model()
         
+        # The model is loaded on the worker thread, so callers (the GUI's
+        # Tk thread) never block on a load or first-run download
         self._is_processing = True
         self._process_thread = threading.Thread(target=self._process_queue)
         self._process_thread.daemon = True
@@ -73,72 +87,122 @@ class TranscriptionManager:
     def stop_processing(self) -> None:
         """Stop the transcription processing"""
         self._is_processing = False
+        self._wake.set()
         if self._process_thread:
             self._process_thread.join()
     
     def transcribe_audio(self, audio_data: np.ndarray,
-                        callback: Optional[Callable[[Dict], None]] = None) -> None:
-        """Queue audio data for transcription"""
-        self._transcription_queue.put((audio_data, callback))
+                        callback: Optional[Callable[[Dict], None]] = None,
+                        sample_rate: int = SAMPLE_RATE) -> None:
+        """Queue mono audio data recorded at sample_rate for transcription"""
+        # Hand the model contiguous mono float32 so feature extraction can
+        # use the buffer as-is (no-op for audio already in that layout)
+        audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+        self._transcription_queue.append((audio_data, sample_rate, callback))
+        self._wake.set()
         if not self._is_processing:
             self.start_processing()
     
+    def transcribe_file(self, filepath: Path,
+                        callback: Optional[Callable[[Dict], None]] = None) -> None:
+        """Queue an audio file for transcription"""
+        # Decode in-process with libsndfile rather than letting the model
+        # spawn a general-purpose decoder for files we wrote ourselves
+        audio_data, sample_rate = sf.read(str(filepath), dtype='float32')
+        if audio_data.ndim > 1:
+            audio_data = audio_data.mean(axis=1, dtype=np.float32)
+        self.transcribe_audio(audio_data, callback, sample_rate=sample_rate)
+    
     def _process_queue(self) -> None:
         """Process queued transcription requests"""
+        if self._pipeline is None:
+            self.initialize_model()
         while self._is_processing:
-            try:
-                audio_data, callback = self._transcription_queue.get(timeout=1.0)
-                result = self._transcribe(audio_data)
-                if callback:
-                    callback(result)
-                self._result_queue.put(result)
-            except queue.Empty:
+            if not self._wake.wait(timeout=1.0):
                 continue
-            except Exception as e:
-                self.logger.error(f"Transcription error: {str(e)}")
+            self._wake.clear()
+            while self._transcription_queue and self._is_processing:
+                audio_data, sample_rate, callback = self._transcription_queue.popleft()
+                try:
+                    # Retried per request if the load at startup failed
+                    if self._pipeline is None and not self.initialize_model():
+                        raise RuntimeError("Whisper model could not be loaded")
+                    result = self._transcribe(self._resample(audio_data, sample_rate))
+                    if callback:
+                        callback(result)
+                    self._result_queue.append(result)
+                except Exception as e:
+                    self.logger.error(f"Transcription error: {str(e)}")
+                    # Failures are reported through the results as well, so
+                    # consumers polling them aren't left waiting
+                    self._result_queue.append({'error': str(e)})
+    
+    def _resample(self, audio_data: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Resample audio to the model's rate in-process, once per request"""
+        if sample_rate == SAMPLE_RATE:
+            return audio_data
+        resampled = signal.resample_poly(audio_data, SAMPLE_RATE, sample_rate)
+        return resampled.astype(np.float32, copy=False)
     
     def _transcribe(self, audio_data: np.ndarray) -> Dict:
         """Perform transcription on audio data"""
         try:
-            with self._lock:
-                result = self.model.transcribe(
+            if self.config.vad_filter:
+                # The batched pipeline splits the recording into speech
+                # windows and decodes batch_size of them per forward pass
+                segments, info = self._pipeline.transcribe(
+                    audio_data,
+                    language=self.config.language,
+                    task=self.config.task,
+                    beam_size=self.config.beam_size,
+                    vad_filter=True,
+                    batch_size=self.config.batch_size
+                )
+            else:
+                # The pipeline needs VAD windows for audio of 30 s or more,
+                # so without VAD decode sequentially with the model itself
+                segments, info = self.model.transcribe(
                     audio_data,
                     language=self.config.language,
                     task=self.config.task,
-                    fp16=(self.config.compute_type == "float16")
+                    beam_size=self.config.beam_size,
+                    vad_filter=False
                 )
-                
-                # Process and format result
-                processed_result = {
-                    'text': result['text'],
-                    'segments': [
-                        {
-                            'text': seg['text'],
-                            'start': seg['start'],
-                            'end': seg['end'],
-                            'confidence': seg['confidence']
-                        }
-                        for seg in result['segments']
-                    ],
-                    'language': result['language']
-                }
-                
-                return processed_result
-                
+            
+            # Process and format result as parallel arrays so consumers can
+            # vectorize over segment timings
+            segments = list(segments)
+            n = len(segments)
+            texts = [seg.text for seg in segments]
+            processed_result = {
+                'text': ''.join(texts),
+                'texts': texts,
+                'starts': np.fromiter((seg.start for seg in segments),
+                                      dtype=np.float32, count=n),
+                'ends': np.fromiter((seg.end for seg in segments),
+                                    dtype=np.float32, count=n),
+                'confidences': np.exp(np.fromiter((seg.avg_logprob for seg in segments),
+                                                  dtype=np.float32, count=n)),
+                'language': info.language
+            }
+            
+            return processed_result
+            
         except Exception as e:
             self.logger.error(f"Transcription processing error: {str(e)}")
             raise
     
     def get_results(self) -> List[Dict]:
-        """Get all available transcription results"""
+        """
+        Get all available transcription results
+        A failed request yields {'error': message} instead of a result.
+        """
         results = []
-        while not self._result_queue.empty():
-            results.append(self._result_queue.get())
+        while self._result_queue:
+            results.append(self._result_queue.popleft())
         return results
     
     def clear_queues(self) -> None:
         """Clear all transcription queues"""
-        while not self._transcription_queue.empty():
-            self._transcription_queue.get()
-        while not self._result_queue.empty():
-            self._result_queue.get()
\ No newline at end of file
+        self._transcription_queue.clear()
+        self._result_queue.clear()
\ No newline at end of file
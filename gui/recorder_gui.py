@@ -2,9 +2,10 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
 from datetime import datetime
+import numpy as np
 from . import visualization
 from audio.recorder import AudioRecorder, AudioConfig
-from audio.transcription import TranscriptionManager, TranscriptionConfig
+from audio.transcription import TranscriptionManager, TranscriptionConfig, SAMPLE_RATE
 from utils.device_utils import DeviceManager
 from utils.file_utils import FileManager
 
@@ -18,7 +19,8 @@ class AudioRecorderGUI:
 
         # Initialize core components
         self.logger = logging.getLogger(__name__)
-        self.audio_recorder = AudioRecorder()
+        # Record at Whisper's native rate so audio can be transcribed as-is
+        self.audio_recorder = AudioRecorder(AudioConfig(sample_rate=SAMPLE_RATE))
         self.transcription_manager = TranscriptionManager()
         self.device_manager = DeviceManager()
         self.file_manager = FileManager()
@@ -27,6 +29,7 @@ class AudioRecorderGUI:
         self._init_variables()
         self._init_gui()
         self._init_bindings()
+        self._poll_transcriptions()
 
     def _init_variables(self):
         """Initialize state variables"""
@@ -111,7 +114,11 @@ class AudioRecorderGUI:
 
     def _create_visualization_section(self):
         """Create audio visualization section"""
-        self.visualizer = visualization.AudioVisualizer(self.main_container)
+        config = visualization.VisualizerConfig(
+            sample_rate=self.audio_recorder.config.sample_rate,
+            max_frequency=self.audio_recorder.config.sample_rate // 2
+        )
+        self.visualizer = visualization.AudioVisualizer(self.main_container, config)
         self.visualizer.frame.pack(fill=tk.X, pady=(0, 10))
 
     def _create_transcription_section(self):
@@ -161,8 +168,10 @@ class AudioRecorderGUI:
         except Exception as e:
             self._handle_error("Failed to start recording", e)
 
-    def _stop_recording(self):
-        """Stop recording"""
+    def _stop_recording(self, transcribe=True):
+        """Stop recording, then save and optionally transcribe it"""
+        if not self.audio_recorder.is_recording:
+            return
         try:
             self.audio_recorder.stop_recording()
             self.record_button.configure(text="Start Recording")
@@ -170,6 +179,8 @@ class AudioRecorderGUI:
             self._stop_timer()
             self._save_recording()
             self._update_status("Recording stopped")
+            if transcribe:
+                self._transcribe_recording()
         except Exception as e:
             self._handle_error("Failed to stop recording", e)
 
@@ -187,8 +198,8 @@ class AudioRecorderGUI:
 
     def _audio_callback(self, indata, frames, time_info, status):
         """Handle incoming audio data"""
-        if status:
-            self.logger.warning(f"Audio callback status: {status}")
+        # Runs on the PortAudio thread; the recorder reports status flags
+        # when recording stops, so nothing is logged here
         if indata is not None:
             self.visualizer.update(indata)
 
@@ -202,6 +213,30 @@ class AudioRecorderGUI:
         except Exception as e:
             self._handle_error("Failed to save recording", e)
 
+    def _transcribe_recording(self):
+        """Queue the in-memory recording for transcription"""
+        audio_data = self.audio_recorder.get_audio_data()
+        if len(audio_data) == 0:
+            return
+        # Downmix to mono; this also copies the audio out of the recorder's
+        # buffer, which is reused by the next recording
+        self.transcription_manager.transcribe_audio(
+            audio_data.mean(axis=1, dtype=np.float32),
+            sample_rate=self.audio_recorder.config.sample_rate
+        )
+        self._update_status("Transcribing...")
+
+    def _poll_transcriptions(self):
+        """Display finished transcriptions"""
+        for result in self.transcription_manager.get_results():
+            if 'error' in result:
+                self._update_status(f"Transcription failed: {result['error']}")
+                continue
+            self.transcript_text.insert(tk.END, result['text'].strip() + "\n")
+            self.transcript_text.see(tk.END)
+            self._update_status("Transcription complete")
+        self.root.after(200, self._poll_transcriptions)
+
     def _start_timer(self):
         """Start the recording timer"""
         self.recording_time = 0
@@ -238,6 +273,7 @@ class AudioRecorderGUI:
 
     def _refresh_devices(self):
         """Refresh the device list"""
+        self.device_manager.invalidate()
         devices = self.device_manager.get_devices()
         self.device_var.set('')
         self.device_combobox['values'] = [f"{dev.id}: {dev.name}" for dev in devices]
@@ -253,7 +289,9 @@ class AudioRecorderGUI:
         if self.audio_recorder.is_recording:
             if not messagebox.askyesno("Exit", "Recording in progress. Stop and exit?"):
                 return
-            self._stop_recording()
+            # The app is exiting, so save the recording but don't start a
+            # transcription that would be thrown away
+            self._stop_recording(transcribe=False)
         self.root.destroy()
 
     def run(self):
@@ -1,10 +1,13 @@
 import tkinter as tk
 from tkinter import ttk
 import numpy as np
+from scipy import fft as sp_fft
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
-import queue
+from matplotlib.transforms import Bbox
+import collections
+import time
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
@@ -13,7 +16,10 @@ class VisualizerConfig:
     """Configuration for the audio visualizer"""
     window_size: int = 4096
     update_interval: int = 50  # milliseconds
+    max_fps: int = 30  # Upper bound on plot redraws per second
+    max_queued_blocks: int = 32  # Oldest blocks are dropped beyond this
     max_frequency: int = 20000  # Hz
+    peak_decay: float = 0.9  # Per-update falloff of the displayed peak level
     sample_rate: int = 44100
     waveform_color: str = '#2196F3'  # Material Blue
     spectrum_color: str = '#4CAF50'  # Material Green
@@ -26,14 +32,19 @@ class AudioVisualizer:
     def __init__(self, parent: tk.Widget, config: Optional[VisualizerConfig] = None):
         self.parent = parent
         self.config = config or VisualizerConfig()
-        self.queue = queue.Queue()
+        # Filled from the audio thread, drained on the Tk thread; deque
+        # append/popleft are atomic so neither side takes a lock. Bounded
+        # so a stalled Tk loop drops stale blocks instead of piling them up
+        self.queue = collections.deque(maxlen=self.config.max_queued_blocks)
         
         # Create main frame
         self.frame = ttk.LabelFrame(parent, text="Audio Visualization", padding="5")
         
         # Initialize data buffers
-        self.waveform_data = np.zeros(self.config.window_size)
-        self.spectrum_data = np.zeros(self.config.window_size // 2)
+        self._init_buffers(self.config.window_size)
+        self._dirty = False
+        self._last_draw = 0.0
+        self._peak = 0.0
         
         # Setup components
         self._create_plots()
@@ -41,6 +52,17 @@ class AudioVisualizer:
         self._create_info_panel()
         self._start_update_loop()
         
+    def _init_buffers(self, window_size: int):
+        """Allocate the data and FFT work buffers for a window size"""
+        # The waveform is a mirrored ring (two copies back to back) so the
+        # latest window is a contiguous slice
+        self.waveform_data = np.zeros(2 * window_size, dtype=np.float32)
+        self._waveform_head = 0
+        self.spectrum_data = np.zeros(window_size // 2, dtype=np.float32)
+        # FFT input and magnitude, reused every frame
+        self._fft_in = np.zeros(window_size, dtype=np.float32)
+        self._fft_mag = np.zeros(window_size // 2 + 1, dtype=np.float32)
+        
     def _create_plots(self):
         """Create the visualization plots"""
         # Create figure with subplots
@@ -50,9 +72,10 @@ class AudioVisualizer:
         self.waveform_ax = self.fig.add_subplot(211)
         self.waveform_line, = self.waveform_ax.plot(
             np.arange(self.config.window_size),
-            self.waveform_data,
+            self._ring_view(self.waveform_data, self._waveform_head),
             color=self.config.waveform_color,
-            linewidth=1
+            linewidth=1,
+            animated=True
         )
         self._setup_waveform_axes()
         
@@ -63,16 +86,29 @@ class AudioVisualizer:
             freqs,
             self.spectrum_data,
             color=self.config.spectrum_color,
-            linewidth=1
+            linewidth=1,
+            animated=True
         )
         self._setup_spectrum_axes()
         
-        # Adjust layout and create canvas
+        # Adjust layout and create canvas; the lines are animated, so full
+        # draws only render the static background, which is cached for blitting
         self.fig.tight_layout(pad=2.0)
+        self._cache_layouts()
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.frame)
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
+    def _cache_layouts(self):
+        """Snapshot axes positions for both plots and for a single plot"""
+        self._layout_waveform = self.waveform_ax.get_position()
+        self._layout_spectrum = self.spectrum_ax.get_position()
+        # A lone plot takes the area of both
+        self._layout_single = Bbox.union([self._layout_waveform,
+                                          self._layout_spectrum])
+        
     def _setup_waveform_axes(self):
         """Configure waveform plot axes"""
         self.waveform_ax.set_title("Waveform", pad=10)
@@ -145,8 +181,8 @@ class AudioVisualizer:
         ttk.Label(info_frame, textvariable=self.rms_var).pack(side=tk.LEFT, padx=10)
         
     def update(self, audio_data: np.ndarray):
-        """Add new audio data to the processing queue"""
-        self.queue.put(audio_data)
+        """Add new audio data to the processing queue (safe from any thread)"""
+        self.queue.append(audio_data)
         
     def _start_update_loop(self):
         """Start the visualization update loop"""
@@ -156,45 +192,111 @@ class AudioVisualizer:
         update()
         
     def _process_audio_queue(self):
-        """Process all queued audio data"""
-        try:
-            while True:
-                audio_data = self.queue.get_nowait()
-                self._update_visualizations(audio_data)
-        except queue.Empty:
-            pass
+        """Process all queued audio data as one coalesced block"""
+        blocks = []
+        while self.queue:
+            blocks.append(self.queue.popleft())
+        if blocks:
+            self._update_visualizations(
+                blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+            )
+        self._redraw()
             
     def _update_visualizations(self, audio_data: np.ndarray):
-        """Update both visualizations with new data"""
+        """Update visualization buffers and metrics with new data"""
         # Update waveform buffer
-        audio_flat = audio_data.flatten()
-        self.waveform_data = np.roll(self.waveform_data, -len(audio_flat))
-        self.waveform_data[-len(audio_flat):] = audio_flat
+        audio_flat = audio_data.astype(np.float32, copy=False).ravel()
+        self._waveform_head = self._ring_write(
+            self.waveform_data, self._waveform_head, audio_flat
+        )
         
-        # Update spectrum buffer
-        if len(audio_flat) >= 2:
-            spectrum = np.abs(np.fft.rfft(audio_flat))
-            spectrum = spectrum / len(spectrum)
-            self.spectrum_data = np.roll(self.spectrum_data, -len(spectrum))
-            self.spectrum_data[-len(spectrum):] = spectrum
+        # Update spectrum from the latest waveform window, once per tick;
+        # the ring is kept current regardless, so this can wait until shown
+        if self.show_spectrum.get():
+            np.copyto(self._fft_in,
+                      self._ring_view(self.waveform_data, self._waveform_head))
+            spectrum = sp_fft.rfft(self._fft_in, overwrite_x=True)
+            np.abs(spectrum, out=self._fft_mag)
+            self._fft_mag /= len(self._fft_mag)
+            self.spectrum_data[:] = self._fft_mag[:len(self.spectrum_data)]
+        
+        # Update audio metrics
+        self._update_audio_metrics(audio_flat)
+        self._dirty = True
+        
+    def _redraw(self):
+        """Push buffered data to the plots, at most max_fps times a second"""
+        now = time.monotonic()
+        if not self._dirty or now - self._last_draw < 1 / self.config.max_fps:
+            return
+        self._dirty = False
+        self._last_draw = now
         
         # Update plots if visible
         if self.show_waveform.get():
-            self.waveform_line.set_ydata(self.waveform_data)
+            self.waveform_line.set_ydata(
+                self._ring_view(self.waveform_data, self._waveform_head)
+            )
             
         if self.show_spectrum.get():
             self.spectrum_line.set_ydata(self.spectrum_data)
         
-        # Update audio metrics
-        self._update_audio_metrics(audio_flat)
+        self._blit()
         
-        # Redraw canvas
-        self.canvas.draw_idle()
+    def _on_draw(self, event):
+        """Cache the static background after every full draw"""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_lines()
+        
+    def _draw_lines(self):
+        """Render the animated lines of the visible plots"""
+        for ax, line in ((self.waveform_ax, self.waveform_line),
+                         (self.spectrum_ax, self.spectrum_line)):
+            if ax.get_visible():
+                ax.draw_artist(line)
+                
+    def _blit(self):
+        """Redraw only the lines over the cached background"""
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_lines()
+        for ax in (self.waveform_ax, self.spectrum_ax):
+            if ax.get_visible():
+                self.canvas.blit(ax.bbox)
+        
+    @staticmethod
+    def _ring_write(buffer: np.ndarray, head: int, samples: np.ndarray) -> int:
+        """Write samples into a mirrored ring buffer, returning the new head"""
+        size = len(buffer) // 2
+        n = len(samples)
+        if n >= size:
+            buffer[:size] = samples[-size:]
+            buffer[size:] = samples[-size:]
+            return 0
+            
+        first = min(n, size - head)
+        rest = n - first
+        buffer[head:head + first] = samples[:first]
+        buffer[head + size:head + size + first] = samples[:first]
+        buffer[:rest] = samples[first:]
+        buffer[size:size + rest] = samples[first:]
+        return (head + n) % size
+        
+    @staticmethod
+    def _ring_view(buffer: np.ndarray, head: int) -> np.ndarray:
+        """Get a mirrored ring buffer's contents, oldest first, without copying"""
+        size = len(buffer) // 2
+        return buffer[head:head + size]
         
     def _update_audio_metrics(self, audio_data: np.ndarray):
         """Update audio level metrics"""
         if len(audio_data) > 0:
-            peak = np.max(np.abs(audio_data))
+            # Single pass per extreme instead of building an abs() copy;
+            # the shown peak decays so a brief transient doesn't flicker
+            peak = max(float(audio_data.max()), -float(audio_data.min()))
+            self._peak = peak = max(self._peak * self.config.peak_decay, peak)
             rms = np.sqrt(np.mean(np.square(audio_data)))
             
             # Convert to dB
@@ -209,23 +311,45 @@ class AudioVisualizer:
         new_size = int(self.window_var.get())
         if new_size != self.config.window_size:
             self.config.window_size = new_size
-            self.waveform_data = np.zeros(new_size)
-            self.spectrum_data = np.zeros(new_size // 2)
+            self._init_buffers(new_size)
             self.waveform_ax.set_xlim(0, new_size)
-            self.waveform_line.set_data(np.arange(new_size), self.waveform_data)
-            self.canvas.draw()
+            self.waveform_line.set_data(np.arange(new_size),
+                                        self.waveform_data[:new_size])
+            self.spectrum_line.set_data(
+                np.linspace(0, self.config.sample_rate/2, new_size // 2),
+                self.spectrum_data
+            )
+            # Axes limits changed, so the cached background is stale; drop
+            # it so ticks fall through to draw_idle, coalesced into one full
+            # draw when Tk is next idle
+            self._background = None
+            self.canvas.draw_idle()
             
     def _update_plot_visibility(self):
         """Update plot visibility based on checkbutton states"""
-        self.waveform_ax.set_visible(self.show_waveform.get())
-        self.spectrum_ax.set_visible(self.show_spectrum.get())
-        self.fig.tight_layout()
-        self.canvas.draw()
+        show_waveform = self.show_waveform.get()
+        show_spectrum = self.show_spectrum.get()
+        self.waveform_ax.set_visible(show_waveform)
+        self.spectrum_ax.set_visible(show_spectrum)
+        
+        # Reuse the cached layouts rather than re-solving tight_layout
+        if show_waveform and show_spectrum:
+            self.waveform_ax.set_position(self._layout_waveform)
+            self.spectrum_ax.set_position(self._layout_spectrum)
+        else:
+            self.waveform_ax.set_position(self._layout_single)
+            self.spectrum_ax.set_position(self._layout_single)
+        # The layout changed, so the cached background is stale
+        self._background = None
+        self.canvas.draw_idle()
     
     def clear(self):
         """Clear all visualization data"""
         self.waveform_data.fill(0)
+        self._waveform_head = 0
         self.spectrum_data.fill(0)
-        self.waveform_line.set_ydata(self.waveform_data)
+        self._peak = 0.0
+        self.waveform_line.set_ydata(self._ring_view(self.waveform_data, 0))
         self.spectrum_line.set_ydata(self.spectrum_data)
-        self.canvas.draw()
\ No newline at end of file
+        # Only the animated lines changed; the background is still valid
+        self._blit()
\ No newline at end of file
@@ -1,11 +1,109 @@
 import numpy as np
 from scipy import signal
-import librosa
+import functools
 from typing import Optional, Tuple, Dict, List
 import logging
 from dataclasses import dataclass
 import sounddevice as sd
 
+try:
+    from numba import njit, float32, float64, types
+except ImportError:  # Numba is optional; kernels then run as plain Python
+    njit = None
+
+def _compress_kernel(x: np.ndarray, out: np.ndarray, attack_coeff: float,
+                     release_coeff: float, threshold_lin: float,
+                     ratio: float) -> np.ndarray:
+    """Envelope follower and gain computer for apply_compression
+
+    Each sample is read before it is written, so out may be x itself.
+    """
+    envelope = 0.0
+    for i in range(x.shape[0]):
+        level = abs(x[i])
+        coeff = attack_coeff if level > envelope else release_coeff
+        envelope = coeff * (envelope - level) + level
+        if envelope > threshold_lin:
+            gain = (threshold_lin + (envelope - threshold_lin) / ratio) / envelope
+        else:
+            gain = 1.0
+        out[i] = x[i] * gain
+    return out
+
+def _scan_kernel(x: np.ndarray) -> Tuple[float, float, int]:
+    """Peak, sum of squares and zero crossings in a single pass"""
+    peak = 0.0
+    sumsq = 0.0
+    crossings = 0
+    # signbit, not v < 0, so -0.0 counts as negative like the NumPy path
+    prev = x.shape[0] > 0 and np.signbit(x[0])
+    for i in range(x.shape[0]):
+        v = x[i]
+        a = abs(v)
+        if a > peak:
+            peak = a
+        sumsq += v * v
+        cur = np.signbit(v)
+        if cur != prev:
+            crossings += 1
+        prev = cur
+    return peak, sumsq, crossings
+
+def _scan_numpy(x: np.ndarray) -> Tuple[float, float, int]:
+    """Vectorized equivalent of _scan_kernel, used without Numba"""
+    signs = np.signbit(x)
+    return (float(np.max(np.abs(x))), float(np.dot(x, x)),
+            int(np.count_nonzero(signs[1:] ^ signs[:-1])))
+
+if njit is not None:
+    # Compiled eagerly for the float32 arrays the processor works on, so the
+    # first call doesn't stall on JIT; cache=True makes later imports a load.
+    # Inputs are typed read-only so memory-mapped temp audio matches too;
+    # writable arrays convert to that type
+    _input_f32 = types.Array(float32, 1, 'A', readonly=True)
+    _compress_kernel = njit((_input_f32, float32[:], float64, float64,
+                             float64, float64),
+                            cache=True, fastmath=True)(_compress_kernel)
+    _scan = njit((_input_f32,), cache=True, fastmath=True)(_scan_kernel)
+else:
+    _scan = _scan_numpy
+
+def _rms(x: np.ndarray) -> float:
+    """Root mean square via a single BLAS dot product"""
+    flat = x.ravel()
+    return float(np.sqrt(np.dot(flat, flat) / flat.size)) if flat.size else 0.0
+
+def _scale_clip(x: np.ndarray, gain: float,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Scale and clip to [-1, 1] into out, or a single new array"""
+    out = np.multiply(x, gain, out=out)
+    return np.clip(out, -1.0, 1.0, out=out)
+
+@functools.lru_cache(maxsize=16)
+def _rfft_freqs(n: int, sample_rate: int) -> np.ndarray:
+    """Bin frequencies for an n-point real FFT (shared, read-only)"""
+    freqs = np.fft.rfftfreq(n, 1 / sample_rate)
+    freqs.flags.writeable = False
+    return freqs
+
+# STFT frame length used by remove_noise
+NOISE_GATE_NPERSEG = 1024
+
+@functools.lru_cache(maxsize=4)
+def _hann_window(n: int) -> np.ndarray:
+    """Hann analysis/synthesis window (shared, read-only)"""
+    window = signal.get_window('hann', n)
+    window.flags.writeable = False
+    return window
+
+@functools.lru_cache(maxsize=32)
+def _band_sos(order: int, low_hz: float, high_hz: float,
+              sample_rate: int) -> np.ndarray:
+    """Design (once) a Butterworth band-pass filter in second-order sections"""
+    nyquist = sample_rate / 2
+    return signal.butter(order, [low_hz / nyquist, high_hz / nyquist],
+                         btype='band', output='sos')
+
 @dataclass
 class AudioMetrics:
     """Container for audio analysis metrics"""
@@ -28,11 +126,12 @@ class AudioProcessor:
     def analyze_audio(self, audio_data: np.ndarray) -> AudioMetrics:
         """Perform comprehensive audio analysis"""
         try:
-            # Basic metrics
-            peak = np.max(np.abs(audio_data))
-            rms = np.sqrt(np.mean(np.square(audio_data)))
+            audio_data = np.asarray(audio_data, dtype=np.float32)
+            
+            # Basic metrics, from one fused pass over the samples
+            peak, sumsq, zero_crossings = _scan(audio_data.ravel())
+            rms = np.sqrt(sumsq / audio_data.size)
             crest_factor = peak / rms if rms > 0 else 0
-            zero_crossings = np.sum(np.diff(np.signbit(audio_data)))
             
             # Volume in dB
             with np.errstate(divide='ignore', invalid='ignore'):
@@ -68,11 +167,12 @@ class AudioProcessor:
                        target_level: float = -3.0) -> np.ndarray:
         """Normalize audio to target RMS level in dB"""
         try:
-            rms = np.sqrt(np.mean(np.square(audio_data)))
+            audio_data = np.asarray(audio_data, dtype=np.float32)
+            rms = _rms(audio_data)
             if rms > 0:
                 current_db = 20 * np.log10(rms)
-                gain = 10**((target_level - current_db) / 20)
-                return np.clip(audio_data * gain, -1.0, 1.0)
+                gain = np.float32(10**((target_level - current_db) / 20))
+                return _scale_clip(audio_data, gain)
             return audio_data
             
         except Exception as e:
@@ -86,17 +186,24 @@ class AudioProcessor:
             # Convert threshold from dB to linear
             threshold = 10**(noise_threshold/20)
             
-            # Compute spectrogram
-            f, t, Sxx = signal.spectrogram(audio_data, fs=self.sample_rate)
+            # A frame needs two samples to overlap-add back
+            if len(audio_data) < 2:
+                return np.array(audio_data, copy=True)
             
-            # Create noise mask
-            mask = Sxx > threshold
+            # Complex STFT, so the gated spectrum keeps its phase; inputs
+            # shorter than one frame use a single input-length frame
+            nperseg = min(NOISE_GATE_NPERSEG, len(audio_data))
+            window = _hann_window(nperseg)
+            _, _, Zxx = signal.stft(audio_data, fs=self.sample_rate,
+                                    window=window, nperseg=nperseg)
             
-            # Apply mask
-            Sxx_clean = Sxx * mask
+            # Zero bins below the threshold in place
+            Zxx[np.abs(Zxx) <= threshold] = 0
             
-            # Reconstruct signal
-            audio_clean = signal.istft(Sxx_clean, fs=self.sample_rate)[1]
+            # Reconstruct signal by overlap-add, trimmed to the input length
+            audio_clean = signal.istft(Zxx, fs=self.sample_rate, window=window,
+                                       nperseg=nperseg)[1]
+            audio_clean = audio_clean[:len(audio_data)]
             
             return audio_clean
             
@@ -108,21 +215,29 @@ class AudioProcessor:
                      effects: Dict[str, float]) -> np.ndarray:
         """Apply various audio effects"""
         try:
-            processed_audio = audio_data.copy()
+            audio_data = np.asarray(audio_data, dtype=np.float32)
+            # Gain and compression write into one buffer instead of each
+            # allocating a fresh copy; the input is never modified
+            processed_audio = np.empty_like(audio_data)
+            source = audio_data
             
             # Apply gain
             if 'gain_db' in effects:
-                processed_audio = self.apply_gain(processed_audio,
-                                               effects['gain_db'])
+                source = self.apply_gain(source, effects['gain_db'],
+                                         out=processed_audio)
             
             # Apply compression
             if 'compression' in effects:
-                processed_audio = self.apply_compression(
-                    processed_audio,
+                source = self.apply_compression(
+                    source,
                     threshold=effects.get('comp_threshold', -20),
-                    ratio=effects.get('comp_ratio', 4)
+                    ratio=effects.get('comp_ratio', 4),
+                    out=processed_audio
                 )
             
+            if source is audio_data:
+                np.copyto(processed_audio, audio_data)
+            
             # Apply EQ
             if 'eq' in effects:
                 processed_audio = self.apply_eq(
@@ -136,10 +251,13 @@ class AudioProcessor:
             self.logger.error(f"Effect processing failed: {str(e)}")
             raise
             
-    def apply_gain(self, audio_data: np.ndarray, gain_db: float) -> np.ndarray:
-        """Apply gain in decibels"""
+    def apply_gain(self, audio_data: np.ndarray, gain_db: float,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Apply gain in decibels, writing into out if given"""
         try:
-            return np.clip(audio_data * (10 ** (gain_db / 20)), -1.0, 1.0)
+            audio_data = np.asarray(audio_data, dtype=np.float32)
+            gain = np.float32(10 ** (gain_db / 20))
+            return _scale_clip(audio_data, gain, out=out)
         except Exception as e:
             self.logger.error(f"Gain application failed: {str(e)}")
             raise
@@ -148,37 +266,23 @@ class AudioProcessor:
                          threshold: float = -20.0,
                          ratio: float = 4.0,
                          attack: float = 0.005,
-                         release: float = 0.1) -> np.ndarray:
-        """Apply dynamic range compression"""
+                         release: float = 0.1,
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Apply dynamic range compression, writing into out if given"""
         try:
+            audio_data = np.asarray(audio_data, dtype=np.float32)
+            
             # Convert threshold from dB to linear
             threshold_lin = 10 ** (threshold / 20)
             
-            # Calculate gain reduction
-            gain_reduction = np.zeros_like(audio_data)
-            envelope = np.zeros_like(audio_data)
-            
             # Time constants
             attack_coeff = np.exp(-1 / (self.sample_rate * attack))
             release_coeff = np.exp(-1 / (self.sample_rate * release))
             
-            # Process samples
-            for i in range(len(audio_data)):
-                # Envelope follower
-                level = np.abs(audio_data[i])
-                if level > envelope[i-1]:
-                    envelope[i] = attack_coeff * (envelope[i-1] - level) + level
-                else:
-                    envelope[i] = release_coeff * (envelope[i-1] - level) + level
-                
-                # Gain computer
-                if envelope[i] > threshold_lin:
-                    gain_reduction[i] = (threshold_lin + 
-                                      (envelope[i] - threshold_lin) / ratio) / envelope[i]
-                else:
-                    gain_reduction[i] = 1.0
-                    
-            return audio_data * gain_reduction
+            if out is None:
+                out = np.empty_like(audio_data)
+            return _compress_kernel(audio_data, out, attack_coeff,
+                                    release_coeff, threshold_lin, ratio)
             
         except Exception as e:
             self.logger.error(f"Compression failed: {str(e)}")
@@ -201,38 +305,60 @@ class AudioProcessor:
                 if band in band_ranges:
                     low, high = band_ranges[band]
                     
-                    # Design band-pass filter
-                    b, a = signal.butter(4, 
-                                       [low/(self.sample_rate/2),
-                                        high/(self.sample_rate/2)],
-                                       btype='band')
+                    # Band-pass filter (cached design)
+                    sos = _band_sos(4, low, high, self.sample_rate)
                     
-                    # Filter and apply gain
-                    filtered = signal.filtfilt(b, a, audio_data)
-                    processed_audio += filtered * (10 ** (gain_db / 20))
+                    # Filter and apply gain in place
+                    filtered = signal.sosfiltfilt(sos, audio_data)
+                    filtered *= 10 ** (gain_db / 20)
+                    np.add(processed_audio, filtered, out=processed_audio)
                     
-            return np.clip(processed_audio, -1.0, 1.0)
+            return np.clip(processed_audio, -1.0, 1.0, out=processed_audio)
             
         except Exception as e:
             self.logger.error(f"EQ processing failed: {str(e)}")
             raise
             
-    def _estimate_pitch(self, audio_data: np.ndarray) -> Optional[float]:
-        """Estimate fundamental frequency using zero-crossing rate"""
+    def _estimate_pitch(self, audio_data: np.ndarray,
+                       fmin: float = 50.0,
+                       fmax: float = 2000.0) -> Optional[float]:
+        """Estimate fundamental frequency from the autocorrelation peak"""
         try:
-            # Use librosa's pitch detection
-            pitches, magnitudes = librosa.piptrack(
-                y=audio_data,
-                sr=self.sample_rate,
-                fmin=50,
-                fmax=2000
-            )
-            
-            # Get the highest magnitude pitch
-            pit = pitches[magnitudes > 0.1]
-            if len(pit) > 0:
-                return float(np.median(pit))
-            return None
+            x = audio_data - np.mean(audio_data)
+            min_lag = max(1, int(self.sample_rate / fmax))
+            max_lag = int(self.sample_rate / fmin)
+            if len(x) <= max_lag + 1:
+                return None
+                
+            # Autocorrelation via FFT, padded just enough that lags up to
+            # max_lag don't wrap around
+            spectrum = np.fft.rfft(x, len(x) + max_lag + 1)
+            acf = np.fft.irfft(np.abs(spectrum) ** 2)[:max_lag + 2]
+            if acf[0] <= 0:
+                return None
+                
+            # Skip the lobe around lag 0: search from the first negative
+            # value (or min_lag, whichever is later)
+            negative = np.flatnonzero(acf[1:max_lag + 1] < 0)
+            if len(negative) == 0:
+                return None
+            start = max(min_lag, 1 + int(negative[0]))
+            
+            # Take the first lag close to the strongest peak, then climb to
+            # its local maximum; this avoids picking a subharmonic
+            candidates = acf[start:max_lag + 1]
+            lag = start + int(np.flatnonzero(candidates >= 0.9 * candidates.max())[0])
+            while lag < max_lag and acf[lag + 1] > acf[lag]:
+                lag += 1
+            # Weakly periodic signals (noise, silence) have no usable pitch
+            if acf[lag] / acf[0] < 0.3:
+                return None
+                
+            # Refine the peak position with parabolic interpolation
+            a, b, c = acf[lag - 1], acf[lag], acf[lag + 1]
+            denom = a - 2 * b + c
+            shift = 0.5 * (a - c) / denom if denom != 0 else 0.0
+            return float(self.sample_rate / (lag + shift))
             
         except Exception as e:
             self.logger.error(f"Pitch estimation failed: {str(e)}")
@@ -244,16 +370,23 @@ class AudioProcessor:
         try:
             # Compute FFT
             fft = np.fft.rfft(audio_data)
-            freqs = np.fft.rfftfreq(len(audio_data), 1/self.sample_rate)
+            freqs = _rfft_freqs(len(audio_data), self.sample_rate)
             magnitudes = np.abs(fft)
             
-            # Find peaks
-            peak_indices = signal.find_peaks(magnitudes)[0]
-            sorted_peaks = sorted(zip(magnitudes[peak_indices],
-                                    freqs[peak_indices]),
-                                reverse=True)
+            # Find peaks, ignoring ones far below the strongest bin
+            peak_indices = signal.find_peaks(
+                magnitudes, height=magnitudes.max() * 1e-3
+            )[0]
+            peak_mags = magnitudes[peak_indices]
+            
+            # Partition out the top n_peaks, then sort only those
+            if len(peak_indices) > n_peaks:
+                top = np.argpartition(peak_mags, -n_peaks)[-n_peaks:]
+            else:
+                top = np.arange(len(peak_indices))
+            order = top[np.argsort(peak_mags[top])[::-1]]
             
-            return [freq for mag, freq in sorted_peaks[:n_peaks]]
+            return freqs[peak_indices[order]].tolist()
             
         except Exception as e:
             self.logger.error(f"Frequency peak detection failed: {str(e)}")
@@ -263,14 +396,17 @@ class AudioProcessor:
                             segment_size: int = 1024) -> np.ndarray:
         """Calculate level meter values for visualization"""
         try:
-            segments = np.array_split(audio_data,
-                                    max(1, len(audio_data) // segment_size))
-            
-            levels = np.array([np.sqrt(np.mean(np.square(s))) for s in segments])
+            # Whole segments as a zero-copy 2-D view, plus any shorter tail
+            n_full = (len(audio_data) // segment_size) * segment_size
+            frames = audio_data[:n_full].reshape(-1, segment_size)
+            levels = np.sqrt(np.einsum('ij,ij->i', frames, frames) / segment_size)
+            if n_full < len(audio_data):
+                levels = np.append(levels, levels.dtype.type(_rms(audio_data[n_full:])))
             
             with np.errstate(divide='ignore', invalid='ignore'):
-                db_levels = 20 * np.log10(levels)
-                db_levels = np.clip(db_levels, -60, 0)
+                db_levels = np.log10(levels)
+                db_levels *= 20
+                np.clip(db_levels, -60, 0, out=db_levels)
                 
             return db_levels
             
@@ -287,32 +423,28 @@ class AudioProcessor:
             frame_length = int(min_duration * self.sample_rate)
             hop_length = frame_length // 2
             
-            rms = librosa.feature.rms(
-                y=audio_data,
-                frame_length=frame_length,
-                hop_length=hop_length
-            )[0]
+            # Frames centered on multiples of hop_length, as strided views
+            padded = np.pad(audio_data, frame_length // 2)
+            frames = np.lib.stride_tricks.sliding_window_view(
+                padded, frame_length
+            )[::hop_length]
+            rms = np.sqrt(np.mean(np.square(frames), axis=1))
             
-            # Convert to dB
-            db = librosa.amplitude_to_db(rms)
+            # Convert to dB, floored 80 dB below the loudest frame
+            db = 20 * np.log10(np.maximum(rms, 1e-5))
+            db = np.maximum(db, db.max() - 80.0)
             
             # Find silent regions
             silent = db < threshold_db
             
-            # Convert frame indices to sample indices
-            silent_regions = []
-            current_start = None
-            
-            for i, is_silent in enumerate(silent):
-                if is_silent and current_start is None:
-                    current_start = i * hop_length
-                elif not is_silent and current_start is not None:
-                    silent_regions.append(
-                        (current_start, i * hop_length)
-                    )
-                    current_start = None
-                    
-            return silent_regions
+            # Run boundaries are where the mask flips; padding with False
+            # on both sides closes runs touching either end
+            edges = np.diff(silent.astype(np.int8), prepend=0, append=0)
+            starts = np.flatnonzero(edges == 1) * hop_length
+            ends = np.minimum(np.flatnonzero(edges == -1) * hop_length,
+                              len(audio_data))
+            
+            return [(int(start), int(end)) for start, end in zip(starts, ends)]
             
         except Exception as e:
             self.logger.error(f"Silence detection failed: {str(e)}")
@@ -1,6 +1,7 @@
 import sounddevice as sd
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
+import time
 from dataclasses import dataclass
 
 @dataclass
@@ -13,58 +14,82 @@ class AudioDevice:
     default_sample_rate: int
     is_default: bool
 
+# Sample rates probed for every input device
+STANDARD_RATES = (44100, 48000, 96000)
+
 class DeviceManager:
     """Manages audio devices and their configurations"""
     
-    def __init__(self):
+    def __init__(self, cache_ttl: float = 5.0):
         self.logger = logging.getLogger(__name__)
+        self.cache_ttl = cache_ttl  # Seconds before device list is re-queried
+        self._cache_time: Optional[float] = None
         self._update_devices()
         
     def _update_devices(self):
         """Update the list of available devices"""
         try:
-            self.devices = []
             default_device = sd.default.device[0]  # Get default input device
+            inputs = [(idx, device)
+                      for idx, device in enumerate(sd.query_devices())
+                      if device['max_input_channels'] > 0]  # Only input devices
+            supported_rates = self._get_supported_rates(inputs)
             
-            for idx, device in enumerate(sd.query_devices()):
-                if device['max_input_channels'] > 0:  # Only input devices
-                    self.devices.append(AudioDevice(
-                        id=idx,
-                        name=device['name'],
-                        channels=device['max_input_channels'],
-                        sample_rates=self._get_supported_rates(device),
-                        default_sample_rate=int(device['default_samplerate']),
-                        is_default=(idx == default_device)
-                    ))
+            # Cached as a tuple so callers can share it without copying
+            self.devices = tuple(
+                AudioDevice(
+                    id=idx,
+                    name=device['name'],
+                    channels=device['max_input_channels'],
+                    sample_rates=supported_rates[idx],
+                    default_sample_rate=int(device['default_samplerate']),
+                    is_default=(idx == default_device)
+                )
+                for idx, device in inputs
+            )
+            self._devices_by_id = {device.id: device for device in self.devices}
+            self._cache_time = time.monotonic()
                     
         except Exception as e:
             self.logger.error(f"Error updating devices: {str(e)}")
             raise
             
-    def _get_supported_rates(self, device: Dict) -> List[int]:
-        """Get supported sample rates for a device"""
-        standard_rates = [44100, 48000, 96000]
-        supported_rates = []
-        
-        for rate in standard_rates:
-            try:
-                sd.check_input_settings(
-                    device=device['name'],
-                    samplerate=rate
-                )
-                supported_rates.append(rate)
-            except:
-                continue
-                
-        return supported_rates
+    def _get_supported_rates(self, inputs: List[Tuple[int, Dict]]) -> Dict[int, List[int]]:
+        """Get supported sample rates for each (index, device) pair"""
+        # Probed one at a time: PortAudio is not thread-safe, and on ALSA
+        # each probe opens the device, so concurrent probes of one device
+        # fail with EBUSY. The TTL cache keeps this off most lookups.
+        return {idx: [rate for rate in STANDARD_RATES
+                      if self._probe_rate(device['name'], rate)]
+                for idx, device in inputs}
     
-    def get_devices(self) -> List[AudioDevice]:
-        """Get list of available input devices"""
-        self._update_devices()
+    @staticmethod
+    def _probe_rate(name: str, rate: int) -> bool:
+        """Check whether an input device accepts a sample rate"""
+        try:
+            sd.check_input_settings(device=name, samplerate=rate)
+            return True
+        except Exception:
+            return False
+    
+    def _ensure_fresh(self) -> None:
+        """Re-query the audio backend if the cached device list has expired"""
+        if (self._cache_time is None or
+                time.monotonic() - self._cache_time >= self.cache_ttl):
+            self._update_devices()
+    
+    def get_devices(self) -> Tuple[AudioDevice, ...]:
+        """Get list of available input devices, re-querying once the cache expires"""
+        self._ensure_fresh()
         return self.devices
     
+    def invalidate(self) -> None:
+        """Force the next get_devices call to re-query the audio backend"""
+        self._cache_time = None
+    
     def get_default_device(self) -> Optional[AudioDevice]:
         """Get the default input device"""
+        self._ensure_fresh()
         for device in self.devices:
             if device.is_default:
                 return device
@@ -80,15 +105,15 @@ class DeviceManager:
             )
             return True
         except Exception as e:
+            # The device may have been unplugged; re-enumerate on next use
+            self.invalidate()
             self.logger.warning(f"Device test failed: {str(e)}")
             return False
     
     def get_device_by_id(self, device_id: int) -> Optional[AudioDevice]:
         """Get device by its ID"""
-        for device in self.devices:
-            if device.id == device_id:
-                return device
-        return None
+        self._ensure_fresh()
+        return self._devices_by_id.get(device_id)
     
     def get_optimal_settings(self, device_id: int) -> Dict:
         """Get optimal audio settings for a device"""
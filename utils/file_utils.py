@@ -3,11 +3,199 @@ from pathlib import Path
 from datetime import datetime
 import json
 import shutil
+import sys
 import logging
-from typing import Optional, Dict, List, Union
-import wave
+import sqlite3
+import threading
+from typing import Optional, Dict, List, Tuple, Union
+import struct
+from contextlib import contextmanager
 import numpy as np
 import soundfile as sf
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is used instead
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON"""
+        # Non-str keys are stringified, as stdlib json does
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    _loads = orjson.loads
+else:
+    def _dumps(obj, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON"""
+        return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+    _loads = json.loads
+
+# Linux ioctl that makes a file share another's extents (Btrfs, XFS)
+FICLONE = 0x40049409
+
+# Extensions get_save_path keeps as given
+_SAVE_EXTENSIONS = frozenset({'.wav', '.txt', '.json'})
+
+# Enough to cover the RIFF header and the fmt/fact/PEAK chunks that precede
+# the data chunk in files written by libsndfile
+WAV_HEADER_BYTES = 512
+
+# PCM, IEEE float and WAVE_FORMAT_EXTENSIBLE: fixed-size frames
+_LINEAR_WAV_FORMATS = (0x0001, 0x0003, 0xFFFE)
+
+# Bytes per sample of libsndfile subtypes, for files parsed via sf.info
+_SUBTYPE_WIDTHS = {'PCM_U8': 1, 'PCM_S8': 1, 'PCM_16': 2, 'PCM_24': 3,
+                   'PCM_32': 4, 'FLOAT': 4, 'DOUBLE': 8}
+
+def _parse_wav_header(header: bytes) -> Optional[Dict]:
+    """Parse format and length from the start of a linear WAV file"""
+    if header[0:4] != b'RIFF' or header[8:12] != b'WAVE':
+        return None
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(header):
+        chunk_id = header[offset:offset + 4]
+        chunk_size, = struct.unpack_from('<I', header, offset + 4)
+        if chunk_id == b'fmt ' and offset + 24 <= len(header):
+            fmt = struct.unpack_from('<HHIIHH', header, offset + 8)
+        elif chunk_id == b'data':
+            if fmt is None or fmt[0] not in _LINEAR_WAV_FORMATS:
+                return None
+            _, channels, frame_rate, _, block_align, bits = fmt
+            n_frames = chunk_size // block_align
+            return {
+                'channels': channels,
+                'sample_width': bits // 8,
+                'frame_rate': frame_rate,
+                'n_frames': n_frames,
+                'duration': n_frames / frame_rate
+            }
+        offset += 8 + chunk_size + (chunk_size & 1)  # Chunks are word aligned
+    return None
+
+def _prefetch(paths: List[str]) -> None:
+    """Ask the kernel to start reading files into the page cache"""
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write a file in one call, replacing any previous version atomically"""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy without moving data through userspace, if the OS supports it"""
+    if fcntl is not None and sys.platform.startswith('linux'):
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)  # Copy-on-write, no data copied
+            return True
+        except OSError:
+            pass
+    if hasattr(os, 'copy_file_range'):
+        try:
+            copied = 0
+            while copied < size:
+                n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if n == 0:
+                    break
+                copied += n
+            return copied == size
+        except OSError:
+            pass
+    return False
+
+def _reflink_or_copy(src: Path, dst: Path) -> None:
+    """Copy a file like shutil.copy2, cloning it where the filesystem can"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        copied = _kernel_copy(fsrc.fileno(), fdst.fileno(), size)
+    if not copied:
+        shutil.copy2(src, dst)
+        return
+    shutil.copystat(src, dst)  # Mode and timestamps, as copy2 keeps them
+
+class _RecordingIndex:
+    """On-disk cache of recording info and metadata, keyed by file stats"""
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self._conn = None
+        # One connection shared by whichever thread lists recordings;
+        # the lock serializes its use
+        self._lock = threading.Lock()
+        
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "name TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, "
+                "meta_mtime_ns INTEGER, info TEXT, metadata TEXT)"
+            )
+        return self._conn
+        
+    def load(self) -> Dict[str, Tuple]:
+        """Get every cached entry as name -> (stat key, info, metadata)"""
+        try:
+            with self._lock:
+                rows = self._connect().execute(
+                    "SELECT name, mtime_ns, size, meta_mtime_ns, info, metadata FROM files"
+                ).fetchall()
+            return {
+                name: ((mtime_ns, size, meta_mtime_ns), _loads(info),
+                       _loads(metadata) if metadata is not None else None)
+                for name, mtime_ns, size, meta_mtime_ns, info, metadata in rows
+            }
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.warning("Ignoring unreadable recording index: %s", e)
+            return {}
+            
+    def update(self, rows: List[Tuple], stale: List[str]) -> None:
+        """Store (name, stat key, info, metadata) rows and drop stale names"""
+        if not rows and not stale:
+            return
+        try:
+            with self._lock, self._connect() as conn:  # One transaction
+                conn.executemany(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                    [(name, *key, _dumps(info),
+                      _dumps(metadata) if metadata is not None else None)
+                     for name, key, info, metadata in rows]
+                )
+                conn.executemany("DELETE FROM files WHERE name = ?",
+                                 [(name,) for name in stale])
+        except sqlite3.Error as e:
+            self.logger.warning("Failed to update recording index: %s", e)
 
 class FileManager:
     """Manages file operations for recordings and transcriptions"""
@@ -25,80 +213,149 @@ class FileManager:
         self.transcripts_dir = self.base_dir / "transcripts"
         self.temp_dir = self.base_dir / "temp"
         self.backup_dir = self.base_dir / "backups"
+        self._dir_map = {
+            "recordings": self.recordings_dir,
+            "transcripts": self.transcripts_dir,
+            "temp": self.temp_dir,
+            "backups": self.backup_dir
+        }
+        
+        # Per-thread (isoformat, file stamp) of an open batch()
+        self._batch = threading.local()
         
         # Create directory structure
         self._setup_directories()
         
+        # Header info and metadata of unchanged recordings, across sessions
+        self._index = _RecordingIndex(self.base_dir / ".index.sqlite")
+        
     def _setup_directories(self) -> None:
         """Create all necessary directories if they don't exist"""
         try:
             for directory in [self.recordings_dir, self.transcripts_dir, 
                             self.temp_dir, self.backup_dir]:
                 directory.mkdir(parents=True, exist_ok=True)
-            self.logger.info(f"Directory structure created at {self.base_dir}")
+            self.logger.info("Directory structure created at %s", self.base_dir)
         except Exception as e:
-            self.logger.error(f"Failed to create directories: {str(e)}")
+            self.logger.error("Failed to create directories: %s", e)
             raise
 
+    @contextmanager
+    def batch(self, timestamp: Optional[datetime] = None):
+        """
+        Stamp every transcript and metadata saved inside the block with one
+        time, formatted once, instead of reading the clock per save
+        Only saves made from the thread that opened the block are affected.
+        """
+        ts = timestamp or datetime.now()
+        # Per thread, so saves from other threads (e.g. a transcription
+        # callback) don't join a batch they didn't open
+        previous = getattr(self._batch, 'timestamps', None)
+        self._batch.timestamps = (ts.isoformat(), ts.strftime("%Y%m%d_%H%M%S"))
+        try:
+            yield self
+        finally:
+            self._batch.timestamps = previous
+
+    def _timestamps(self) -> Tuple[str, str]:
+        """Get the (isoformat, file stamp) pair for the current save"""
+        timestamps = getattr(self._batch, 'timestamps', None)
+        if timestamps is not None:
+            return timestamps
+        now = datetime.now()
+        return now.isoformat(), now.strftime("%Y%m%d_%H%M%S")
+
     def get_save_path(self, filename: str, directory: str = "recordings") -> Path:
         """Get the full path for saving a file"""
-        if not filename.endswith(('.wav', '.txt', '.json')):
+        if os.path.splitext(filename)[1] not in _SAVE_EXTENSIONS:
             filename += '.wav'  # Default to WAV for audio files
-            
-        dir_map = {
-            "recordings": self.recordings_dir,
-            "transcripts": self.transcripts_dir,
-            "temp": self.temp_dir,
-            "backups": self.backup_dir
-        }
         
-        return dir_map.get(directory, self.recordings_dir) / filename
+        return self._dir_map.get(directory, self.recordings_dir) / filename
 
     def save_audio(self, audio_data: Union[bytes, np.ndarray], 
                   filename: str, 
                   sample_rate: int = 44100,
-                  metadata: Optional[Dict] = None) -> Path:
+                  metadata: Optional[Dict] = None,
+                  directory: str = "recordings") -> Path:
         """
         Save audio data to file with optional metadata
+        Arrays saved to "temp" are intermediates for this pipeline, so they
+        are stored as raw .npy (no sample rate) rather than encoded as WAV;
+        read them back with load_temp_audio.
         """
         try:
-            filepath = self.get_save_path(filename)
+            filepath = self.get_save_path(filename, directory)
+            as_npy = directory == "temp" and isinstance(audio_data, np.ndarray)
+            if as_npy:
+                filepath = filepath.with_suffix('.npy')
+            
+            # Encode metadata up front so bad metadata fails before any
+            # audio is written, and the sidecar is then a single write
+            meta_payload = (self._encode_metadata(filepath, metadata)
+                            if metadata else None)
             
             # Save audio file
             if isinstance(audio_data, bytes):
                 with open(filepath, 'wb') as f:
                     f.write(audio_data)
+            elif as_npy:
+                np.save(filepath, audio_data)
             else:
-                sf.write(str(filepath), audio_data, sample_rate)
+                sf.write(os.fspath(filepath), audio_data, sample_rate)
             
             # Save metadata if provided
-            if metadata:
-                self.save_metadata(filepath, metadata)
+            if meta_payload is not None:
+                _atomic_write_bytes(filepath.with_suffix('.json'), meta_payload)
                 
-            self.logger.info(f"Saved audio to {filepath}")
+            self.logger.info("Saved audio to %s", filepath)
             return filepath
             
         except Exception as e:
-            self.logger.error(f"Failed to save audio: {str(e)}")
+            self.logger.error("Failed to save audio: %s", e)
             raise
 
+    @contextmanager
+    def save_audio_stream(self, filename: str, sample_rate: int = 44100,
+                          channels: int = 1, subtype: str = 'PCM_16'):
+        """
+        Open one audio file for a recording saved chunk by chunk
+        Yields a soundfile.SoundFile; call write(chunk) per block. The header
+        is finalized once, when the block exits.
+        """
+        filepath = self.get_save_path(filename)
+        try:
+            with sf.SoundFile(os.fspath(filepath), 'w', samplerate=sample_rate,
+                              channels=channels, subtype=subtype) as f:
+                yield f
+            self.logger.info("Saved audio to %s", filepath)
+        except Exception as e:
+            self.logger.error("Failed to save audio: %s", e)
+            raise
+
+    def load_temp_audio(self, filepath: Path) -> np.ndarray:
+        """Map an intermediate .npy file saved by save_audio, without copying"""
+        return np.load(filepath, mmap_mode='r')
+
+    def _encode_metadata(self, audio_path: Path, metadata: Dict) -> bytes:
+        """Serialize the sidecar contents for an audio file"""
+        metadata_with_timestamp = {
+            'timestamp': self._timestamps()[0],
+            'audio_file': audio_path.name,
+            **metadata
+        }
+        return _dumps(metadata_with_timestamp, indent=True)
+
     def save_metadata(self, audio_path: Path, metadata: Dict) -> Path:
         """Save metadata for an audio file"""
         try:
             meta_path = audio_path.with_suffix('.json')
-            metadata_with_timestamp = {
-                'timestamp': datetime.now().isoformat(),
-                'audio_file': audio_path.name,
-                **metadata
-            }
-            
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata_with_timestamp, f, indent=2)
-                
+            # One write of the encoded document rather than a write per token
+            _atomic_write_bytes(meta_path,
+                                self._encode_metadata(audio_path, metadata))
             return meta_path
             
         except Exception as e:
-            self.logger.error(f"Failed to save metadata: {str(e)}")
+            self.logger.error("Failed to save metadata: %s", e)
             raise
 
     def save_transcript(self, text: str, audio_filename: str, 
@@ -108,47 +365,117 @@ class FileManager:
         Supported formats: txt, json, srt
         """
         try:
-            base_name = Path(audio_filename).stem
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            if format == 'txt':
-                filepath = self.transcripts_dir / f"{base_name}_transcript_{timestamp}.txt"
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(text)
-                    
-            elif format == 'json':
-                filepath = self.transcripts_dir / f"{base_name}_transcript_{timestamp}.json"
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump({'transcript': text, 'timestamp': timestamp}, f, indent=2)
-                    
-            elif format == 'srt':
-                filepath = self.transcripts_dir / f"{base_name}_transcript_{timestamp}.srt"
-                self._save_as_srt(text, filepath)
-                
-            else:
-                raise ValueError(f"Unsupported format: {format}")
-                
-            self.logger.info(f"Saved transcript to {filepath}")
+            timestamp = self._timestamps()[1]
+            filepath, data = self._encode_transcript(text, audio_filename,
+                                                     format, timestamp)
+            filepath = self._write_transcript(self._claim_path(filepath), data)
+            self.logger.info("Saved transcript to %s", filepath)
             return filepath
             
         except Exception as e:
-            self.logger.error(f"Failed to save transcript: {str(e)}")
+            self.logger.error("Failed to save transcript: %s", e)
             raise
 
-    def _save_as_srt(self, text: str, filepath: Path) -> None:
-        """Save transcript in SRT subtitle format"""
+    def save_transcripts_batch(self, items: List[Tuple[str, str, str]]) -> List[Path]:
+        """
+        Save several (text, audio_filename, format) transcripts at once
+        All payloads are encoded before any file is written.
+        """
+        if not items:
+            return []
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                segments = text.split('\n\n')
-                for i, segment in enumerate(segments, 1):
-                    if segment.strip():
-                        f.write(f"{i}\n")
-                        f.write("00:00:00,000 --> 00:00:00,000\n")  # Placeholder timings
-                        f.write(f"{segment.strip()}\n\n")
+            timestamp = self._timestamps()[1]
+            encoded = [self._encode_transcript(text, audio_filename,
+                                               format, timestamp)
+                       for text, audio_filename, format in items]
+            # Claimed in order before any write, so repeated (recording,
+            # format) pairs get distinct names instead of replacing each other
+            claimed = []
+            try:
+                for filepath, _ in encoded:
+                    claimed.append(self._claim_path(filepath))
+            except BaseException:
+                for path in claimed:  # Don't leave empty placeholders
+                    path.unlink(missing_ok=True)
+                raise
+            
+            # Writes are I/O bound (fsync), so overlap them. Submitted one by
+            # one rather than with map, which cancels pending writes on the
+            # first error and would leave their placeholders behind
+            with ThreadPoolExecutor(max_workers=min(8, len(items))) as pool:
+                futures = [pool.submit(self._write_transcript, path, data)
+                           for path, (_, data) in zip(claimed, encoded)]
+            paths = [future.result() for future in futures]
+            
+            self.logger.info("Saved %d transcripts to %s", len(paths), self.transcripts_dir)
+            return paths
+            
         except Exception as e:
-            self.logger.error(f"Failed to save SRT: {str(e)}")
+            self.logger.error("Failed to save transcripts: %s", e)
             raise
 
+    def _scan_transcripts(self) -> Dict[str, List[Path]]:
+        """Map recording stems to their transcripts with one directory scan"""
+        index = {}
+        with os.scandir(self.transcripts_dir) as it:
+            for entry in it:
+                base_name, sep, _ = entry.name.rpartition('_transcript_')
+                if sep:
+                    index.setdefault(base_name, []).append(Path(entry.path))
+        return index
+
+    def _encode_transcript(self, text: str, audio_filename: str, format: str,
+                           timestamp: str) -> Tuple[Path, bytes]:
+        """Get a transcript's path and its encoded contents"""
+        base_name = Path(audio_filename).stem
+        filepath = self.transcripts_dir / f"{base_name}_transcript_{timestamp}.{format}"
+        
+        if format == 'txt':
+            return filepath, text.encode('utf-8')
+        elif format == 'json':
+            return filepath, _dumps({'transcript': text, 'timestamp': timestamp},
+                                    indent=True)
+        elif format == 'srt':
+            return filepath, self._encode_srt(text)
+        raise ValueError(f"Unsupported format: {format}")
+
+    def _claim_path(self, filepath: Path) -> Path:
+        """
+        Reserve filepath, or the first free numbered variant of it
+        Transcripts saved for the same recording within one timestamp (e.g.
+        inside batch()) would otherwise share a name. The empty placeholder
+        is replaced by the atomic write.
+        """
+        candidate = filepath
+        n = 1
+        while True:
+            try:
+                os.close(os.open(candidate,
+                                 os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+                return candidate
+            except FileExistsError:
+                n += 1
+                candidate = filepath.with_name(f"{filepath.stem}_{n}{filepath.suffix}")
+
+    def _write_transcript(self, filepath: Path, data: bytes) -> Path:
+        """Write an encoded transcript over its claimed placeholder"""
+        try:
+            _atomic_write_bytes(filepath, data)
+        except BaseException:
+            filepath.unlink(missing_ok=True)
+            raise
+        return filepath
+
+    def _encode_srt(self, text: str) -> bytes:
+        """Encode transcript in SRT subtitle format"""
+        # Segments keep their position in text as their index, so blank
+        # ones leave gaps in the numbering as before
+        return ''.join(
+            f"{i}\n00:00:00,000 --> 00:00:00,000\n{segment}\n\n"  # Placeholder timings
+            for i, segment in enumerate(map(str.strip, text.split('\n\n')), 1)
+            if segment
+        ).encode('utf-8')
+
     def list_recordings(self, sort_by: str = 'date') -> List[Dict]:
         """
         List all recordings with their metadata
@@ -156,54 +483,119 @@ class FileManager:
         """
         recordings = []
         try:
-            for filepath in self.recordings_dir.glob('*.wav'):
-                info = self.get_audio_info(filepath)
-                metadata = self.get_metadata(filepath)
-                recordings.append({
-                    'path': filepath,
-                    'filename': filepath.name,
-                    'info': info,
-                    'metadata': metadata
-                })
+            # One directory pass finds both the recordings and their JSON
+            # sidecars; DirEntry.stat() reuses what scandir already fetched
+            wav_entries = []
+            sidecars = {}
+            with os.scandir(self.recordings_dir) as it:
+                for entry in it:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext == '.wav':
+                        wav_entries.append(entry)
+                    elif ext == '.json':
+                        sidecars[stem] = entry
+            
+            # Reuse indexed info and metadata for recordings whose file and
+            # sidecar are unchanged; only the rest are opened and parsed
+            index = self._index.load()
+            misses = []
+            for entry in wav_entries:
+                st = entry.stat()
+                sidecar = sidecars.get(os.path.splitext(entry.name)[0])
+                key = (st.st_mtime_ns, st.st_size,
+                       sidecar.stat().st_mtime_ns if sidecar else None)
+                record = {
+                    'path': Path(entry.path),
+                    'filename': entry.name,
+                    'mtime': st.st_mtime
+                }
+                cached = index.pop(entry.name, None)
+                if cached is not None and cached[0] == key:
+                    record['info'], record['metadata'] = cached[1], cached[2]
+                else:
+                    misses.append((record, key, sidecar))
+                recordings.append(record)
+            
+            # Sidecars are read after each header, so have the kernel fetch
+            # them in the background while the headers are parsed
+            miss_sidecars = [sidecar.path for _, _, sidecar in misses if sidecar]
+            if miss_sidecars and hasattr(os, 'posix_fadvise'):
+                pool = ThreadPoolExecutor(max_workers=1)
+                pool.submit(_prefetch, miss_sidecars)
+                pool.shutdown(wait=False)
             
+            for record, key, sidecar in misses:
+                record['info'] = self.get_audio_info(record['path'])
+                record['metadata'] = self.get_metadata(record['path'], sidecars)
+            # Entries left in index belong to recordings that are gone
+            self._index.update(
+                [(record['filename'], key, record['info'], record['metadata'])
+                 for record, key, _ in misses],
+                list(index)
+            )
+            
+            # Sort keys gathered into arrays so the sort runs in NumPy rather
+            # than calling a key function per recording; stable and negated
+            # for descending order, matching list.sort(reverse=True)
             if sort_by == 'date':
-                recordings.sort(key=lambda x: x['path'].stat().st_mtime, reverse=True)
+                keys = -np.fromiter((r['mtime'] for r in recordings),
+                                    dtype=np.float64, count=len(recordings))
             elif sort_by == 'name':
-                recordings.sort(key=lambda x: x['filename'])
+                keys = np.array([r['filename'] for r in recordings])
             elif sort_by == 'duration':
-                recordings.sort(key=lambda x: x['info'].get('duration', 0), reverse=True)
-                
-            return recordings
+                keys = -np.fromiter((r['info'].get('duration', 0) for r in recordings),
+                                    dtype=np.float64, count=len(recordings))
+            else:
+                return recordings
+            return [recordings[i] for i in np.argsort(keys, kind='stable')]
             
         except Exception as e:
-            self.logger.error(f"Failed to list recordings: {str(e)}")
+            self.logger.error("Failed to list recordings: %s", e)
             return []
 
     def get_audio_info(self, filepath: Path) -> Dict:
         """Get technical information about an audio file"""
         try:
-            with wave.open(str(filepath), 'rb') as wav:
-                return {
-                    'channels': wav.getnchannels(),
-                    'sample_width': wav.getsampwidth(),
-                    'frame_rate': wav.getframerate(),
-                    'n_frames': wav.getnframes(),
-                    'duration': wav.getnframes() / wav.getframerate()
-                }
+            # One small read and a chunk walk instead of wave's many reads
+            with open(filepath, 'rb') as f:
+                info = _parse_wav_header(f.read(WAV_HEADER_BYTES))
+            if info is not None:
+                return info
+            
+            # Compressed or unusual layouts: libsndfile still only reads
+            # the header
+            sf_info = sf.info(str(filepath))
+            return {
+                'channels': sf_info.channels,
+                'sample_width': _SUBTYPE_WIDTHS.get(sf_info.subtype, 0),
+                'frame_rate': sf_info.samplerate,
+                'n_frames': sf_info.frames,
+                'duration': sf_info.duration
+            }
         except Exception as e:
-            self.logger.error(f"Failed to get audio info: {str(e)}")
+            self.logger.error("Failed to get audio info: %s", e)
             return {}
 
-    def get_metadata(self, filepath: Path) -> Optional[Dict]:
-        """Get metadata for an audio file"""
+    def get_metadata(self, filepath: Path,
+                     sidecars: Optional[Dict[str, os.PathLike]] = None) -> Optional[Dict]:
+        """
+        Get metadata for an audio file
+        sidecars maps stems to the JSON files of an already scanned
+        directory, so a missing sidecar costs no stat call.
+        """
         try:
-            meta_path = filepath.with_suffix('.json')
-            if meta_path.exists():
-                with open(meta_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            if sidecars is not None:
+                meta_path = sidecars.get(filepath.stem)
+            else:
+                meta_path = filepath.with_suffix('.json')
+                if not meta_path.exists():
+                    meta_path = None
+            if meta_path is not None:
+                with open(meta_path, 'rb') as f:
+                    return _loads(f.read())
             return None
         except Exception as e:
-            self.logger.error(f"Failed to read metadata: {str(e)}")
+            self.logger.error("Failed to read metadata: %s", e)
             return None
 
     def create_backup(self, filepath: Path) -> Path:
@@ -211,49 +603,67 @@ class FileManager:
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = self.backup_dir / f"{filepath.stem}_backup_{timestamp}{filepath.suffix}"
-            shutil.copy2(filepath, backup_path)
-            self.logger.info(f"Created backup at {backup_path}")
+            _reflink_or_copy(filepath, backup_path)
+            self.logger.info("Created backup at %s", backup_path)
             return backup_path
         except Exception as e:
-            self.logger.error(f"Failed to create backup: {str(e)}")
+            self.logger.error("Failed to create backup: %s", e)
             raise
 
     def cleanup_temp_files(self, max_age_days: int = 7) -> None:
         """Remove temporary files older than specified days"""
         try:
             cutoff = datetime.now().timestamp() - (max_age_days * 24 * 60 * 60)
-            for item in self.temp_dir.iterdir():
-                if item.stat().st_mtime < cutoff:
-                    if item.is_file():
-                        item.unlink()
-                    elif item.is_dir():
-                        shutil.rmtree(item)
+            # DirEntry answers is_file/is_dir from the directory listing
+            files, dirs = [], []
+            with os.scandir(self.temp_dir) as it:
+                for entry in it:
+                    if entry.stat().st_mtime < cutoff:
+                        if entry.is_file():
+                            files.append(entry.path)
+                        elif entry.is_dir():
+                            dirs.append(entry.path)
+            
+            # Unlinks are I/O bound, so overlap them
+            if files:
+                with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+                    list(pool.map(os.unlink, files))
+            for path in dirs:
+                shutil.rmtree(path)
             self.logger.info("Cleaned up temporary files")
         except Exception as e:
-            self.logger.error(f"Failed to cleanup temp files: {str(e)}")
+            self.logger.error("Failed to cleanup temp files: %s", e)
             raise
 
     def delete_recording(self, filepath: Path, create_backup: bool = True) -> None:
         """Delete a recording and its associated files"""
+        self.delete_recordings_batch([filepath], create_backup)
+
+    def delete_recordings_batch(self, filepaths: List[Path],
+                                create_backup: bool = True) -> None:
+        """Delete several recordings and their associated files"""
         try:
-            if create_backup:
-                self.create_backup(filepath)
-                
-            # Delete main audio file
-            filepath.unlink()
-            
-            # Delete associated files
-            meta_path = filepath.with_suffix('.json')
-            if meta_path.exists():
-                meta_path.unlink()
-                
-            # Delete associated transcripts
-            base_name = filepath.stem
-            for transcript in self.transcripts_dir.glob(f"{base_name}_transcript_*"):
-                transcript.unlink()
+            # Scanned per call so transcripts written by other instances or
+            # processes are found too
+            transcripts = self._scan_transcripts()
+            for filepath in filepaths:
+                if create_backup:
+                    self.create_backup(filepath)
+                    
+                # Delete main audio file
+                filepath.unlink()
                 
-            self.logger.info(f"Deleted recording: {filepath}")
+                # Delete associated files
+                meta_path = filepath.with_suffix('.json')
+                if meta_path.exists():
+                    meta_path.unlink()
+                    
+                # Delete associated transcripts
+                for transcript in transcripts.pop(filepath.stem, []):
+                    transcript.unlink()
+                    
+                self.logger.info("Deleted recording: %s", filepath)
             
         except Exception as e:
-            self.logger.error(f"Failed to delete recording: {str(e)}")
-            raise
\ No newline at end of file
+            self.logger.error("Failed to delete recording: %s", e)
+            raise